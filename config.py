@@ -2,12 +2,27 @@
 Configuration management for the Playwright Web Scraper.
 """
 
+import copy
 import yaml
-import json
-from typing import Dict, Any, List, Union, Optional
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Union, Optional, Tuple, get_args, get_origin
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
 
+from utils import json_dumps, json_loads
+
+# Prefer the libyaml C bindings, fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Parsed configurations keyed by (resolved path, mtime), most recently used last
+_CONFIG_CACHE_SIZE = 64
+_config_cache: 'OrderedDict[Tuple[str, int], ScrapingConfig]' = OrderedDict()
+_config_cache_lock = threading.Lock()
+
 
 @dataclass
 class ScrapingConfig:
@@ -22,15 +37,20 @@ class ScrapingConfig:
     user_agent: Optional[str] = None
     viewport: Dict[str, int] = field(default_factory=lambda: {'width': 1280, 'height': 720})
     max_pages: int = 1
+    max_parallel_pages: int = 3
     wait_for_selector: Optional[str] = None
     export_format: str = 'json'
     output_file: str = 'scraped_data'
+    stream_output: Optional[str] = None
     
     # Advanced options
     javascript_enabled: bool = True
     images_enabled: bool = False
     css_enabled: bool = True
     follow_redirects: bool = True
+    block_resources: List[str] = field(default_factory=lambda: ['media', 'font', 'analytics'])
+    persistent_context: bool = False
+    user_data_dir: str = '.pw-cache'
     
     # Anti-bot measures
     random_delay: bool = True
@@ -52,15 +72,41 @@ class ScrapingConfig:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, 'r', encoding='utf-8') as f:
+        # Reuse the parsed config while the file is unchanged; callers get a copy
+        # so mutating the result never leaks into the cache
+        cache_key = (str(config_file.resolve()), config_file.stat().st_mtime_ns)
+        with _config_cache_lock:
+            cached = _config_cache.get(cache_key)
+            if cached is not None:
+                _config_cache.move_to_end(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        with open(config_file, 'rb') as f:
             if config_file.suffix.lower() in ['.yaml', '.yml']:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_YamlLoader)
             elif config_file.suffix.lower() == '.json':
-                config_data = json.load(f)
+                config_data = json_loads(f.read())
             else:
                 raise ValueError(f"Unsupported configuration file format: {config_file.suffix}")
         
-        return cls(**config_data)
+        # Fail fast on malformed files instead of deep inside the scraper
+        if not isinstance(config_data, dict):
+            raise ValueError(f"Configuration file must contain a mapping: {config_path}")
+        
+        unknown_keys = config_data.keys() - _FIELD_TYPES.keys()
+        if unknown_keys:
+            raise ValueError(f"Unknown configuration keys: {', '.join(sorted(unknown_keys))}")
+        
+        config = cls(**config_data)
+        config.validate()
+        
+        with _config_cache_lock:
+            _config_cache[cache_key] = config
+            while len(_config_cache) > _CONFIG_CACHE_SIZE:
+                _config_cache.popitem(last=False)
+        
+        return copy.deepcopy(config)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -69,25 +115,7 @@ class ScrapingConfig:
         Returns:
             Dictionary representation of configuration
         """
-        return {
-            'url': self.url,
-            'selectors': self.selectors,
-            'headless': self.headless,
-            'delay': self.delay,
-            'timeout': self.timeout,
-            'user_agent': self.user_agent,
-            'viewport': self.viewport,
-            'max_pages': self.max_pages,
-            'wait_for_selector': self.wait_for_selector,
-            'export_format': self.export_format,
-            'output_file': self.output_file,
-            'javascript_enabled': self.javascript_enabled,
-            'images_enabled': self.images_enabled,
-            'css_enabled': self.css_enabled,
-            'follow_redirects': self.follow_redirects,
-            'random_delay': self.random_delay,
-            'rotate_user_agent': self.rotate_user_agent
-        }
+        return asdict(self)
     
     def save_to_file(self, config_path: str):
         """
@@ -99,13 +127,14 @@ class ScrapingConfig:
         config_file = Path(config_path)
         config_data = self.to_dict()
         
-        with open(config_file, 'w', encoding='utf-8') as f:
-            if config_file.suffix.lower() in ['.yaml', '.yml']:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
-            elif config_file.suffix.lower() == '.json':
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
-            else:
-                raise ValueError(f"Unsupported configuration file format: {config_file.suffix}")
+        if config_file.suffix.lower() in ['.yaml', '.yml']:
+            with open(config_file, 'w', encoding='utf-8') as f:
+                yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+        elif config_file.suffix.lower() == '.json':
+            with open(config_file, 'wb') as f:
+                f.write(json_dumps(config_data, indent=True))
+        else:
+            raise ValueError(f"Unsupported configuration file format: {config_file.suffix}")
     
     def validate(self):
         """
@@ -114,6 +143,13 @@ class ScrapingConfig:
         Raises:
             ValueError: If configuration is invalid
         """
+        # Type checks against the schema compiled from the field annotations,
+        # including list items and dict keys/values
+        for name, schema in _FIELD_TYPES.items():
+            error = _type_error(getattr(self, name), schema, name)
+            if error:
+                raise ValueError(error)
+        
         if not self.url:
             raise ValueError("URL is required")
         
@@ -129,6 +165,9 @@ class ScrapingConfig:
         if self.max_pages <= 0:
             raise ValueError("Max pages must be positive")
         
+        if self.max_parallel_pages <= 0:
+            raise ValueError("Max parallel pages must be positive")
+        
         if 'width' not in self.viewport or 'height' not in self.viewport:
             raise ValueError("Viewport must contain width and height")
         
@@ -136,6 +175,86 @@ class ScrapingConfig:
             raise ValueError("Viewport dimensions must be positive")
 
 
+def _expected_types(annotation) -> Tuple[Tuple[type, Tuple[Any, ...]], ...]:
+    """
+    Resolve a field annotation to the runtime types accepted for it.
+    
+    Args:
+        annotation: Type annotation of a dataclass field
+        
+    Returns:
+        Tuple of alternatives, each a (type usable with isinstance, schemas of
+        its type arguments) pair; the argument schemas are the list item schema
+        or the dict key and value schemas, and empty for other types
+    """
+    origin = get_origin(annotation)
+    
+    if origin is Union:
+        return tuple(alt for arg in get_args(annotation) for alt in _expected_types(arg))
+    if annotation is float:
+        # Integers are acceptable wherever a float is expected
+        return ((int, ()), (float, ()))
+    if annotation is None or annotation is type(None):
+        return ((type(None), ()),)
+    if origin in (list, dict):
+        return ((origin, tuple(_expected_types(arg) for arg in get_args(annotation))),)
+    
+    return ((origin or annotation, ()),)
+
+
+def _type_error(value: Any, schema: Tuple[Tuple[type, Tuple[Any, ...]], ...], path: str) -> Optional[str]:
+    """
+    Check a value against a schema from _expected_types.
+    
+    Args:
+        value: Value to check
+        schema: Accepted alternatives for the value
+        path: Name of the value in error messages, e.g. 'viewport.width'
+        
+    Returns:
+        Error message for the first mismatch, or None if the value matches
+    """
+    # bool subclasses int, so True/False only pass where bool is expected
+    candidates = [
+        (expected, args) for expected, args in schema
+        if isinstance(value, expected) and (type(value) is not bool or expected is bool)
+    ]
+    if not candidates:
+        expected = ' or '.join(t.__name__ for t, _ in schema)
+        return f"Invalid type for '{path}': expected {expected}, got {type(value).__name__}"
+    
+    error = None
+    for expected, args in candidates:
+        member_error = _member_type_error(value, expected, args, path)
+        if member_error is None:
+            return None
+        error = error or member_error
+    
+    return error
+
+
+def _member_type_error(value: Any, expected: type, args: Tuple[Any, ...], path: str) -> Optional[str]:
+    """Check list items or dict keys and values against their schemas."""
+    if expected is list:
+        for i, item in enumerate(value):
+            error = _type_error(item, args[0], f"{path}[{i}]")
+            if error:
+                return error
+    elif expected is dict:
+        key_schema, value_schema = args
+        for key, item in value.items():
+            error = (_type_error(key, key_schema, f"{path} key {key!r}")
+                     or _type_error(item, value_schema, f"{path}.{key}"))
+            if error:
+                return error
+    
+    return None
+
+
+# Field type schema, compiled once from the ScrapingConfig annotations
+_FIELD_TYPES = {f.name: _expected_types(f.type) for f in fields(ScrapingConfig)}
+
+
 # Default configuration templates
 DEFAULT_CONFIGS = {
     'news_scraper': {
@@ -176,7 +295,7 @@ def create_config_template(template_name: str, output_path: str = 'config.yaml')
     }
     
     with open(output_path, 'w', encoding='utf-8') as f:
-        yaml.dump(base_config, f, default_flow_style=False, indent=2)
+        yaml.dump(base_config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
     
     print(f"Configuration template '{template_name}' saved to {output_path}")
     print("Please edit the 'url' field and other parameters as needed.")
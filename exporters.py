@@ -2,14 +2,84 @@
 Data export utilities for the Playwright Web Scraper.
 """
 
-import json
 import csv
-import pandas as pd
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
+from utils import json_dumps
+
+logger = logging.getLogger(__name__)
+
+
+# Common abbreviations restored after title-casing column names
+_ABBREVIATIONS = {
+    'Url': 'URL',
+    'Html': 'HTML',
+    'Css': 'CSS',
+    'Id': 'ID',
+    'Api': 'API'
+}
+_ABBREVIATIONS_RE = re.compile('|'.join(_ABBREVIATIONS))
+
+
+@lru_cache(maxsize=4096)
+def _clean_column_name(name: str) -> str:
+    """
+    Clean a column name (memoized, the result depends only on the input).
+    
+    Args:
+        name: Original column name
+        
+    Returns:
+        Cleaned column name
+    """
+    # Replace underscores with spaces and title case
+    cleaned = name.replace('_', ' ').title()
+    
+    # Handle common abbreviations in a single pass
+    return _ABBREVIATIONS_RE.sub(lambda match: _ABBREVIATIONS[match.group(0)], cleaned)
+
+
+def _clean_str(value: str):
+    """Strip strings; only non-empty strings are kept."""
+    # Fast path: no whitespace can sit at either end, so skip strip(). The
+    # range stops below U+0085, the first non-ASCII whitespace character
+    if value and ' ' < value[0] < '\x85' and ' ' < value[-1] < '\x85':
+        return True, value
+    
+    value = value.strip()
+    return bool(value), value
+
+
+def _clean_container(value):
+    """Keep dicts and lists as-is for CSV compatibility, unless empty."""
+    return bool(value), value
+
+
+def _dumps_list(value: list) -> str:
+    """Serialize a list to a JSON string for flat (CSV) output."""
+    return json_dumps(value, default=str).decode('utf-8')
+
+
+def _excel_cell(value):
+    """Coerce a flattened value to a type xlsxwriter writes natively."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+# Value cleaners keyed by exact type; other types are kept unchanged
+_CLEANERS = {
+    str: _clean_str,
+    dict: _clean_container,
+    list: _clean_container
+}
+
 
 class DataExporter:
     """
@@ -17,7 +87,7 @@ class DataExporter:
     """
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
     
     def export(self, data: List[Dict[str, Any]], filename: str, format_type: str) -> str:
         """
@@ -62,6 +132,7 @@ class DataExporter:
             Cleaned data
         """
         cleaned_data = []
+        append = cleaned_data.append
         
         for item in data:
             if not isinstance(item, dict):
@@ -74,24 +145,17 @@ class DataExporter:
                 if value is None:
                     continue
                 
-                # Clean string values
-                if isinstance(value, str):
-                    cleaned_value = value.strip()
-                    if cleaned_value:  # Only keep non-empty strings
-                        cleaned_item[key] = cleaned_value
-                elif isinstance(value, dict):
-                    # Keep dictionaries as JSON strings for CSV compatibility
-                    if value:  # Only keep non-empty dicts
-                        cleaned_item[key] = value
-                elif isinstance(value, list):
-                    # Keep lists as JSON strings for CSV compatibility
-                    if value:  # Only keep non-empty lists
-                        cleaned_item[key] = value
-                else:
+                cleaner = _CLEANERS.get(type(value))
+                if cleaner is None:
                     cleaned_item[key] = value
+                    continue
+                
+                keep, cleaned_value = cleaner(value)
+                if keep:
+                    cleaned_item[key] = cleaned_value
             
             if cleaned_item:  # Only add non-empty items
-                cleaned_data.append(cleaned_item)
+                append(cleaned_item)
         
         self.logger.info(f"Cleaned data: {len(data)} -> {len(cleaned_data)} items")
         return cleaned_data
@@ -110,15 +174,17 @@ class DataExporter:
         output_file = f"{filename}.json"
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'metadata': {
-                        'exported_at': datetime.now().isoformat(),
-                        'total_items': len(data),
-                        'format': 'json'
-                    },
-                    'data': data
-                }, f, indent=2, ensure_ascii=False, default=str)
+            payload = {
+                'metadata': {
+                    'exported_at': datetime.now().isoformat(),
+                    'total_items': len(data),
+                    'format': 'json'
+                },
+                'data': data
+            }
+            
+            with open(output_file, 'wb') as f:
+                f.write(json_dumps(payload, default=str, indent=True))
             
             self.logger.info(f"Data exported to JSON: {output_file}")
             return output_file
@@ -146,22 +212,20 @@ class DataExporter:
         
         try:
             # Flatten nested dictionaries and lists for CSV compatibility
-            flattened_data = []
-            for item in data:
-                flattened_item = self.flatten_dict(item)
-                flattened_data.append(flattened_item)
-            
-            # Use pandas for better CSV handling
-            df = pd.DataFrame(flattened_data)
+            flattened_data, fieldnames = self._flatten_rows(data)
             
-            # Clean column names
-            df.columns = [self.clean_column_name(col) for col in df.columns]
+            # Map columns to clean names
+            clean_names = {key: self.clean_column_name(key) for key in fieldnames}
             
-            # Export to CSV
-            df.to_csv(output_file, index=False, encoding='utf-8')
+            # Stream rows straight to disk
+            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=[clean_names[key] for key in fieldnames])
+                writer.writeheader()
+                for item in flattened_data:
+                    writer.writerow({clean_names[key]: value for key, value in item.items()})
             
             self.logger.info(f"Data exported to CSV: {output_file}")
-            self.logger.info(f"CSV shape: {df.shape[0]} rows, {df.shape[1]} columns")
+            self.logger.info(f"CSV shape: {len(flattened_data)} rows, {len(fieldnames)} columns")
             
             return output_file
             
@@ -187,31 +251,18 @@ class DataExporter:
             return output_file
         
         try:
-            # Create DataFrame
-            df = pd.DataFrame(data)
+            try:
+                import xlsxwriter
+            except ImportError:
+                xlsxwriter = None
             
-            # Clean column names
-            df.columns = [self.clean_column_name(col) for col in df.columns]
-            
-            # Export to Excel with metadata sheet
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                # Main data sheet
-                df.to_excel(writer, sheet_name='Scraped_Data', index=False)
-                
-                # Metadata sheet
-                metadata_df = pd.DataFrame({
-                    'Property': ['Exported At', 'Total Items', 'Columns', 'Format'],
-                    'Value': [
-                        datetime.now().isoformat(),
-                        len(data),
-                        df.shape[1],
-                        'excel'
-                    ]
-                })
-                metadata_df.to_excel(writer, sheet_name='Metadata', index=False)
+            if xlsxwriter:
+                rows, columns = self._write_excel_streaming(xlsxwriter, data, output_file)
+            else:
+                rows, columns = self._write_excel_pandas(data, output_file)
             
             self.logger.info(f"Data exported to Excel: {output_file}")
-            self.logger.info(f"Excel shape: {df.shape[0]} rows, {df.shape[1]} columns")
+            self.logger.info(f"Excel shape: {rows} rows, {columns} columns")
             
             return output_file
             
@@ -219,6 +270,102 @@ class DataExporter:
             self.logger.error(f"Failed to export Excel: {str(e)}")
             raise
     
+    def _write_excel_streaming(self, xlsxwriter, data: List[Dict[str, Any]], output_file: str) -> Tuple[int, int]:
+        """
+        Write an Excel file with xlsxwriter in constant memory mode.
+        
+        Rows are flushed to disk as soon as a later row is written, so cells are
+        written strictly row by row (pandas' to_excel writes column by column
+        and cannot be used in this mode).
+        
+        Args:
+            xlsxwriter: The imported xlsxwriter module
+            data: Cleaned scraped data
+            output_file: Path of the workbook to create
+            
+        Returns:
+            Tuple of (rows, columns) written to the data sheet
+        """
+        flattened_data, fieldnames = self._flatten_rows(data)
+        
+        workbook = xlsxwriter.Workbook(output_file, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False
+        })
+        try:
+            # Main data sheet
+            sheet = workbook.add_worksheet('Scraped_Data')
+            sheet.write_row(0, 0, [self.clean_column_name(key) for key in fieldnames])
+            for row, item in enumerate(flattened_data, start=1):
+                sheet.write_row(row, 0, [_excel_cell(item.get(key)) for key in fieldnames])
+            
+            # Metadata sheet
+            metadata = workbook.add_worksheet('Metadata')
+            metadata.write_row(0, 0, ['Property', 'Value'])
+            metadata.write_row(1, 0, ['Exported At', datetime.now().isoformat()])
+            metadata.write_row(2, 0, ['Total Items', len(data)])
+            metadata.write_row(3, 0, ['Columns', len(fieldnames)])
+            metadata.write_row(4, 0, ['Format', 'excel'])
+        finally:
+            workbook.close()
+        
+        return len(flattened_data), len(fieldnames)
+    
+    def _write_excel_pandas(self, data: List[Dict[str, Any]], output_file: str) -> Tuple[int, int]:
+        """
+        Write an Excel file with pandas and openpyxl (used when xlsxwriter is not installed).
+        
+        Args:
+            data: Cleaned scraped data
+            output_file: Path of the workbook to create
+            
+        Returns:
+            Tuple of (rows, columns) written to the data sheet
+        """
+        # pandas is heavy to import and only needed for this fallback
+        import pandas as pd
+        
+        # Same flattened rows and columns as the streaming writer
+        flattened_data, fieldnames = self._flatten_rows(data)
+        df = pd.DataFrame(
+            [[_excel_cell(item.get(key)) for key in fieldnames] for item in flattened_data],
+            columns=[self.clean_column_name(key) for key in fieldnames]
+        )
+        
+        # Export to Excel with metadata sheet
+        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+            # Main data sheet
+            df.to_excel(writer, sheet_name='Scraped_Data', index=False)
+            
+            # Metadata sheet
+            metadata_df = pd.DataFrame({
+                'Property': ['Exported At', 'Total Items', 'Columns', 'Format'],
+                'Value': [
+                    datetime.now().isoformat(),
+                    len(data),
+                    df.shape[1],
+                    'excel'
+                ]
+            })
+            metadata_df.to_excel(writer, sheet_name='Metadata', index=False)
+        
+        return df.shape[0], df.shape[1]
+    
+    def _flatten_rows(self, data: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Flatten all items and collect their columns in first-seen order.
+        
+        Args:
+            data: Cleaned scraped data
+            
+        Returns:
+            Tuple of (flattened items, column keys)
+        """
+        flattened_data = [self.flatten_dict(item) for item in data]
+        fieldnames = list(dict.fromkeys(key for item in flattened_data for key in item))
+        return flattened_data, fieldnames
+    
     def flatten_dict(self, d: Dict[str, Any], parent_key: str = '', sep: str = '_') -> Dict[str, Any]:
         """
         Flatten nested dictionary for CSV export.
@@ -231,20 +378,28 @@ class DataExporter:
         Returns:
             Flattened dictionary
         """
-        items = []
+        flattened = {}
         
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            
-            if isinstance(v, dict):
-                items.extend(self.flatten_dict(v, new_key, sep=sep).items())
-            elif isinstance(v, list):
-                # Convert lists to JSON strings
-                items.append((new_key, json.dumps(v, default=str)))
+        # Walk nested dicts with an explicit stack of item iterators; resuming
+        # the parent iterator afterwards keeps the recursive key order
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                elif isinstance(v, list):
+                    # Convert lists to JSON strings
+                    flattened[new_key] = _dumps_list(v)
+                else:
+                    flattened[new_key] = v
             else:
-                items.append((new_key, v))
+                stack.pop()
         
-        return dict(items)
+        return flattened
     
     def clean_column_name(self, name: str) -> str:
         """
@@ -256,22 +411,7 @@ class DataExporter:
         Returns:
             Cleaned column name
         """
-        # Replace underscores with spaces and title case
-        cleaned = name.replace('_', ' ').title()
-        
-        # Handle common abbreviations
-        replacements = {
-            'Url': 'URL',
-            'Html': 'HTML',
-            'Css': 'CSS',
-            'Id': 'ID',
-            'Api': 'API'
-        }
-        
-        for old, new in replacements.items():
-            cleaned = cleaned.replace(old, new)
-        
-        return cleaned
+        return _clean_column_name(name)
     
     def get_summary_stats(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -286,27 +426,36 @@ class DataExporter:
         if not data:
             return {'total_items': 0}
         
-        # Basic stats
-        stats = {
-            'total_items': len(data),
-            'unique_urls': len(set(item.get('url', '') for item in data)),
-            'unique_selectors': len(set(item.get('selector', '') for item in data))
-        }
+        urls = set()
+        selectors = set()
+        coverage = Counter()
         
-        # Field coverage
-        all_fields = set()
+        # Single pass over the data; fields with only empty values keep a zero count
         for item in data:
-            all_fields.update(item.keys())
+            urls.add(item.get('url', ''))
+            selectors.add(item.get('selector', ''))
+            for key, value in item.items():
+                coverage[key] += 1 if value else 0
         
-        field_coverage = {}
-        for field in all_fields:
-            count = sum(1 for item in data if field in item and item[field])
-            field_coverage[field] = {
+        total = len(data)
+        field_coverage = {
+            field: {
                 'count': count,
-                'percentage': (count / len(data)) * 100
+                'percentage': (count / total) * 100
             }
+            for field, count in coverage.items()
+        }
         
-        stats['total_fields'] = len(all_fields)
-        stats['field_coverage'] = field_coverage
+        stats = {
+            'total_items': total,
+            'unique_urls': len(urls),
+            'unique_selectors': len(selectors),
+            'total_fields': len(field_coverage),
+            'field_coverage': field_coverage
+        }
         
         return stats
+
+
+# Shared exporter instance; DataExporter holds no per-export state
+default_exporter = DataExporter()
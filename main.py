@@ -11,9 +11,9 @@ import sys
 from pathlib import Path
 from typing import Dict, Any
 
-from scraper import PlaywrightScraper
+from scraper import PlaywrightScraper, browser_pool
 from config import ScrapingConfig
-from exporters import DataExporter
+from exporters import default_exporter as exporter
 from utils import setup_logging, validate_url
 
 
@@ -106,6 +106,16 @@ Examples:
         # Perform scraping
         scraped_data = await scraper.scrape()
         
+        # Streamed items are already on disk
+        if config.stream_output:
+            if not scraper.items_streamed:
+                logger.warning("No data was scraped from the target URL")
+                sys.exit(1)
+            
+            logger.info(f"Streamed {scraper.items_streamed} data points to: {config.stream_output}")
+            logger.info("Scraping completed successfully!")
+            return
+        
         if not scraped_data:
             logger.warning("No data was scraped from the target URL")
             sys.exit(1)
@@ -113,7 +123,6 @@ Examples:
         logger.info(f"Successfully scraped {len(scraped_data)} data points")
         
         # Export data
-        exporter = DataExporter()
         output_file = exporter.export(scraped_data, args.output, args.format)
         
         logger.info(f"Data exported to: {output_file}")
@@ -125,6 +134,8 @@ Examples:
     except Exception as e:
         logger.error(f"Scraping failed: {str(e)}")
         sys.exit(1)
+    finally:
+        await browser_pool.close()
 
 
 if __name__ == '__main__':
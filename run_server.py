@@ -5,35 +5,103 @@ Provides a simple web interface to configure and run scraping tasks.
 """
 
 import asyncio
-import json
 import logging
+import os
+import secrets
+from collections import OrderedDict
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
+from typing import Optional
 import threading
-import queue
 import time
 
 from scraper import PlaywrightScraper
 from config import ScrapingConfig
-from exporters import DataExporter
-from utils import setup_logging, validate_url
+from exporters import default_exporter as exporter
+from utils import ORJSON_AVAILABLE, json_dumps, json_loads, setup_logging, validate_url
+
+
+class OrJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return json_dumps(obj, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return json_loads(s)
 
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-change-this'
+if ORJSON_AVAILABLE:
+    app.json = OrJSONProvider(app)
 
-# Global variables for task management
-scraping_tasks = {}
-task_queue = queue.Queue()
+# Global variables for task management, bounded to the most recently used tasks
+MAX_STORED_TASKS = 512
+scraping_tasks = OrderedDict()
 results_storage = {}
+storage_lock = threading.Lock()
+
+# Persistent event loop shared by all scraping tasks, run in a background thread
+scraping_loop = asyncio.new_event_loop()
+threading.Thread(target=scraping_loop.run_forever, name='scraping-loop', daemon=True).start()
 
 # Setup logging
 setup_logging('INFO')
 logger = logging.getLogger(__name__)
 
 
+def store_task(task_id: str, task_info: dict):
+    """Register a task, evicting the least recently used ones over capacity."""
+    with storage_lock:
+        scraping_tasks[task_id] = task_info
+        scraping_tasks.move_to_end(task_id)
+        
+        while len(scraping_tasks) > MAX_STORED_TASKS:
+            old_task_id, _ = scraping_tasks.popitem(last=False)
+            remove_results(results_storage.pop(old_task_id, None))
+
+
+def store_results(task_id: str, result_info: dict):
+    """Store results for a task that is still tracked."""
+    with storage_lock:
+        if task_id in scraping_tasks:
+            results_storage[task_id] = result_info
+            return
+    
+    # Task was evicted while running
+    remove_results(result_info)
+
+
+def remove_results(result_info: Optional[dict]):
+    """Delete the export file belonging to evicted results."""
+    export_file = result_info.get('export_file') if result_info else None
+    if export_file:
+        try:
+            os.remove(export_file)
+        except OSError:
+            pass
+
+
+def serialize_preview(items: list) -> bytes:
+    """Serialize preview items to compact JSON bytes."""
+    return json_dumps(items, default=str)
+
+
+def get_task(task_id: str):
+    """Look up a task and its results, marking the task as recently used."""
+    with storage_lock:
+        task_info = scraping_tasks.get(task_id)
+        if task_info is not None:
+            scraping_tasks.move_to_end(task_id)
+        return task_info, results_storage.get(task_id)
+
+
 @app.route('/')
 def index():
     """Main page with scraping interface."""
@@ -72,20 +140,18 @@ def start_scraping():
         config = ScrapingConfig(**config_data)
         
         # Generate task ID
-        task_id = f"task_{int(time.time() * 1000)}"
+        task_id = f"task_{secrets.token_hex(8)}"
         
         # Store task info
-        scraping_tasks[task_id] = {
+        store_task(task_id, {
             'status': 'queued',
             'config': config,
             'created_at': time.time(),
             'progress': 0
-        }
+        })
         
-        # Start scraping in background
-        thread = threading.Thread(target=run_scraping_task, args=(task_id, config))
-        thread.daemon = True
-        thread.start()
+        # Start scraping on the background event loop
+        asyncio.run_coroutine_threadsafe(run_scraping_task(task_id, config), scraping_loop)
         
         return jsonify({
             'task_id': task_id,
@@ -101,11 +167,10 @@ def start_scraping():
 @app.route('/api/status/<task_id>')
 def get_task_status(task_id):
     """Get status of a scraping task."""
-    if task_id not in scraping_tasks:
+    task_info, result_info = get_task(task_id)
+    if task_info is None:
         return jsonify({'error': 'Task not found'}), 404
     
-    task_info = scraping_tasks[task_id]
-    
     response = {
         'task_id': task_id,
         'status': task_info['status'],
@@ -114,8 +179,7 @@ def get_task_status(task_id):
     }
     
     # Add results if completed
-    if task_info['status'] == 'completed' and task_id in results_storage:
-        result_info = results_storage[task_id]
+    if task_info['status'] == 'completed' and result_info:
         response.update({
             'total_items': result_info.get('total_items', 0),
             'export_file': result_info.get('export_file'),
@@ -132,25 +196,27 @@ def get_task_status(task_id):
 @app.route('/api/results/<task_id>')
 def get_task_results(task_id):
     """Get results of a completed scraping task."""
-    if task_id not in scraping_tasks:
+    task_info, result_info = get_task(task_id)
+    if task_info is None:
         return jsonify({'error': 'Task not found'}), 404
     
-    if scraping_tasks[task_id]['status'] != 'completed':
+    if task_info['status'] != 'completed':
         return jsonify({'error': 'Task not completed yet'}), 400
     
-    if task_id not in results_storage:
+    if result_info is None:
         return jsonify({'error': 'Results not found'}), 404
     
-    return jsonify(results_storage[task_id]['data'])
+    # Preview is stored pre-serialized, so it is sent without re-encoding
+    return Response(result_info['data_bytes'], mimetype='application/json')
 
 
 @app.route('/api/download/<task_id>')
 def download_results(task_id):
     """Download results file."""
-    if task_id not in scraping_tasks or task_id not in results_storage:
+    task_info, result_info = get_task(task_id)
+    if task_info is None or result_info is None:
         return jsonify({'error': 'Task not found or no results available'}), 404
     
-    result_info = results_storage[task_id]
     export_file = result_info.get('export_file')
     
     if not export_file or not Path(export_file).exists():
@@ -162,8 +228,12 @@ def download_results(task_id):
 @app.route('/api/tasks')
 def list_tasks():
     """List all scraping tasks."""
+    with storage_lock:
+        tasks = list(scraping_tasks.items())
+        results = dict(results_storage)
+    
     tasks_list = []
-    for task_id, task_info in scraping_tasks.items():
+    for task_id, task_info in tasks:
         task_summary = {
             'task_id': task_id,
             'status': task_info['status'],
@@ -172,8 +242,8 @@ def list_tasks():
             'progress': task_info['progress']
         }
         
-        if task_info['status'] == 'completed' and task_id in results_storage:
-            task_summary['total_items'] = results_storage[task_id].get('total_items', 0)
+        if task_info['status'] == 'completed' and task_id in results:
+            task_summary['total_items'] = results[task_id].get('total_items', 0)
         
         tasks_list.append(task_summary)
     
@@ -198,57 +268,55 @@ def validate_url_endpoint():
     return jsonify({'valid': is_valid, 'message': message})
 
 
-def run_scraping_task(task_id: str, config: ScrapingConfig):
-    """Run scraping task in background thread."""
+async def run_scraping_task(task_id: str, config: ScrapingConfig):
+    """Run scraping task on the background event loop."""
+    task_info, _ = get_task(task_id)
+    if task_info is None:
+        logger.warning(f"Task {task_id} was evicted before it started")
+        return
+    
     try:
         # Update task status
-        scraping_tasks[task_id]['status'] = 'running'
-        scraping_tasks[task_id]['progress'] = 10
+        task_info['status'] = 'running'
+        task_info['progress'] = 10
         
-        # Create new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        # Run scraping; browsers stay warm in the shared pool between tasks
+        scraper = PlaywrightScraper(config)
+        scraped_data = await scraper.scrape()
+        
+        task_info['progress'] = 70
+        
+        if not scraped_data:
+            raise Exception("No data was scraped from the target URL")
+        
+        # Export data off the event loop so other tasks keep scraping
+        export_file = await asyncio.to_thread(
+            exporter.export, scraped_data, f"web_scrape_{task_id}", 'json'
+        )
+        
+        task_info['progress'] = 90
+        
+        # Generate summary stats
+        summary_stats = exporter.get_summary_stats(scraped_data)
+        
+        # Store results
+        store_results(task_id, {
+            'data_bytes': serialize_preview(scraped_data[:100]),  # First 100 items for preview
+            'total_items': len(scraped_data),
+            'export_file': export_file,
+            'summary': summary_stats
+        })
+        
+        # Mark as completed
+        task_info['status'] = 'completed'
+        task_info['progress'] = 100
+        
+        logger.info(f"Task {task_id} completed successfully. Scraped {len(scraped_data)} items.")
         
-        try:
-            # Run scraping
-            scraper = PlaywrightScraper(config)
-            scraped_data = loop.run_until_complete(scraper.scrape())
-            
-            scraping_tasks[task_id]['progress'] = 70
-            
-            if not scraped_data:
-                raise Exception("No data was scraped from the target URL")
-            
-            # Export data
-            exporter = DataExporter()
-            export_file = exporter.export(scraped_data, f"web_scrape_{task_id}", 'json')
-            
-            scraping_tasks[task_id]['progress'] = 90
-            
-            # Generate summary stats
-            summary_stats = exporter.get_summary_stats(scraped_data)
-            
-            # Store results
-            results_storage[task_id] = {
-                'data': scraped_data[:100],  # Store first 100 items for preview
-                'total_items': len(scraped_data),
-                'export_file': export_file,
-                'summary': summary_stats
-            }
-            
-            # Mark as completed
-            scraping_tasks[task_id]['status'] = 'completed'
-            scraping_tasks[task_id]['progress'] = 100
-            
-            logger.info(f"Task {task_id} completed successfully. Scraped {len(scraped_data)} items.")
-            
-        finally:
-            loop.close()
-            
     except Exception as e:
         logger.error(f"Task {task_id} failed: {str(e)}")
-        scraping_tasks[task_id]['status'] = 'failed'
-        scraping_tasks[task_id]['error_message'] = str(e)
+        task_info['status'] = 'failed'
+        task_info['error_message'] = str(e)
 
 
 if __name__ == '__main__':
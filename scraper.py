@@ -6,11 +6,269 @@ Handles the main scraping logic using Playwright browser automation.
 import asyncio
 import logging
 import random
+import time
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
 from config import ScrapingConfig
+from utils import json_dumps
+
+
+# Chromium launch flags used for every browser
+BROWSER_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-background-networking',
+    '--disable-sync'
+]
+
+# Maximum time (ms) to wait for network idle after DOMContentLoaded
+NETWORK_SETTLE_TIMEOUT = 2000
+
+# Navigation attempts per URL, and the initial backoff (s) between them
+NAVIGATION_ATTEMPTS = 3
+NAVIGATION_RETRY_DELAY = 0.5
+
+# Bound on items waiting for the stream writer, and items written per batch
+STREAM_QUEUE_SIZE = 1024
+STREAM_BATCH_SIZE = 256
+
+# Hosts whose requests are dropped when 'analytics' is in block_resources
+ANALYTICS_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'hotjar.com',
+    'segment.io'
+)
+
+
+# Selectors for common cookie/consent banners, tried in order
+COOKIE_SELECTORS = (
+    '[id*="cookie"]',
+    '[class*="cookie"]',
+    '[id*="consent"]',
+    '[class*="consent"]',
+    'button[aria-label*="Accept"]',
+    'button[aria-label*="Close"]'
+)
+
+# Clicks the first visible cookie banner match; returns its selector or null
+DISMISS_COOKIE_BANNER_JS = '''
+    selectors => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (!element) {
+                continue;
+            }
+            const rect = element.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0 && getComputedStyle(element).visibility !== 'hidden') {
+                element.click();
+                return selector;
+            }
+        }
+        return null;
+    }
+'''
+
+# Scrolls halfway down, lets a frame render so lazy loaders fire, then scrolls back
+SCROLL_PAGE_JS = '''
+    async () => {
+        window.scrollTo(0, document.body.scrollHeight / 2);
+        await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+        window.scrollTo(0, 0);
+    }
+'''
+
+# Extracts all fields for every match of a selector in a single round-trip.
+# Links and image sources are resolved against the document's base URL
+EXTRACT_ELEMENTS_JS = '''
+    elements => {
+        const absoluteUrl = value => {
+            try {
+                return value ? new URL(value, document.baseURI).href : null;
+            } catch (e) {
+                return null;
+            }
+        };
+        return elements.map(element => {
+            const attrs = {};
+            const dataAttrs = {};
+            for (const attr of element.attributes) {
+                attrs[attr.name] = attr.value;
+                if (attr.name.startsWith('data-')) {
+                    dataAttrs[attr.name] = attr.value;
+                }
+            }
+            return {
+                text: (element.textContent || '').trim(),
+                html: element.innerHTML.trim(),
+                attributes: attrs,
+                data_attributes: dataAttrs,
+                link: absoluteUrl(element.getAttribute('href')),
+                image_src: absoluteUrl(element.getAttribute('src'))
+            };
+        });
+    }
+'''
+
+# Same extraction for a single element handle, used by the per-element fallback
+EXTRACT_ELEMENT_JS = f'element => ({EXTRACT_ELEMENTS_JS.strip()})([element])[0]'
+
+
+def _write_json_lines(stream_file, items: List[Dict[str, Any]]):
+    """Write items to a binary file as JSON lines in one call."""
+    stream_file.write(b''.join(json_dumps(item, default=str) + b'\n' for item in items))
+
+
+class BrowserPool:
+    """
+    Keeps Playwright and the browsers warm across scrape jobs.
+    
+    One browser is kept per launch signature (only `headless` affects the
+    launch); every job gets its own fresh context from it.
+    
+    The driver, browsers and locks belong to the event loop that created
+    them; when the pool is used from a new loop (e.g. a second asyncio.run)
+    they are dropped and started again on that loop.
+    """
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reset()
+    
+    def _reset(self):
+        """Forget the driver, browsers and locks of the previous event loop."""
+        self._playwright: Optional[Playwright] = None
+        self._browsers: Dict[bool, Browser] = {}
+        self._lock = asyncio.Lock()
+        
+        # A profile directory can only be open in one browser at a time
+        self._profile_locks: Dict[str, asyncio.Lock] = {}
+        self._held_profiles: Dict[BrowserContext, asyncio.Lock] = {}
+    
+    def _bind_loop(self):
+        """Tie the pool to the running event loop, resetting it if the loop changed."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._loop is not None:
+                self.logger.debug("Event loop changed, discarding browsers from the previous loop")
+            self._loop = loop
+            self._reset()
+    
+    async def get_browser(self, headless: bool) -> Browser:
+        """
+        Return a running browser, launching it on first use or after a crash.
+        
+        Args:
+            headless: Whether the browser runs headless
+            
+        Returns:
+            Shared browser instance
+        """
+        self._bind_loop()
+        async with self._lock:
+            browser = self._browsers.get(headless)
+            if browser is None or not browser.is_connected():
+                await self._start_playwright()
+                browser = await self._playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+                self._browsers[headless] = browser
+                self.logger.info("Browser launched")
+            return browser
+    
+    async def acquire_context(self, headless: bool, **options) -> BrowserContext:
+        """
+        Create a fresh context on the shared browser.
+        
+        Args:
+            headless: Whether the browser runs headless
+            **options: Options passed to Browser.new_context
+            
+        Returns:
+            New browser context
+        """
+        browser = await self.get_browser(headless)
+        return await browser.new_context(**options)
+    
+    async def acquire_persistent_context(self, user_data_dir: str, headless: bool,
+                                         **options) -> BrowserContext:
+        """
+        Launch a persistent context whose profile (HTTP cache, cookies) lives on disk.
+        
+        Jobs sharing a profile directory wait for each other, since Chromium
+        cannot open one profile twice.
+        
+        Args:
+            user_data_dir: Profile directory, reused across jobs
+            headless: Whether the browser runs headless
+            **options: Options passed to launch_persistent_context
+            
+        Returns:
+            New persistent browser context
+        """
+        self._bind_loop()
+        profile_lock = self._profile_locks.setdefault(str(Path(user_data_dir).resolve()), asyncio.Lock())
+        await profile_lock.acquire()
+        
+        try:
+            async with self._lock:
+                await self._start_playwright()
+            
+            context = await self._playwright.chromium.launch_persistent_context(
+                user_data_dir, headless=headless, args=BROWSER_ARGS, **options
+            )
+        except BaseException:
+            profile_lock.release()
+            raise
+        
+        self._held_profiles[context] = profile_lock
+        return context
+    
+    async def release(self, context: BrowserContext):
+        """
+        Close a context obtained from this pool; shared browsers stay up.
+        
+        Args:
+            context: Context to release
+        """
+        try:
+            await context.close()
+        finally:
+            profile_lock = self._held_profiles.pop(context, None)
+            if profile_lock is not None:
+                profile_lock.release()
+    
+    async def _start_playwright(self):
+        """Start the Playwright driver if needed; call with the pool lock held."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+    
+    async def close(self):
+        """Close all browsers and stop Playwright."""
+        self._bind_loop()
+        async with self._lock:
+            for browser in self._browsers.values():
+                try:
+                    await browser.close()
+                except Exception as e:
+                    self.logger.error(f"Error closing browser: {str(e)}")
+            self._browsers.clear()
+            
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+# Process-wide pool shared by all scrapers
+browser_pool = BrowserPool()
 
 
 class PlaywrightScraper:
@@ -23,6 +281,9 @@ class PlaywrightScraper:
         self.logger = logging.getLogger(__name__)
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        self._blocked_resources = self.get_blocked_resources()
+        self.items_streamed = 0
+        self._idle_pages: List[Page] = []
         
         # User agents for rotation
         self.user_agents = [
@@ -43,77 +304,139 @@ class PlaywrightScraper:
         await self.close()
     
     async def initialize_browser(self):
-        """Initialize Playwright browser and context."""
+        """Acquire a browser context from the shared browser pool."""
         try:
-            self.playwright = await async_playwright().start()
-            
-            # Launch browser
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.config.headless,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-features=VizDisplayCompositor'
-                ]
-            )
-            
             # Create browser context with configuration
             user_agent = self.config.user_agent or random.choice(self.user_agents)
             
-            self.context = await self.browser.new_context(
-                user_agent=user_agent,
-                viewport={
+            context_options = {
+                'user_agent': user_agent,
+                'viewport': {
                     'width': self.config.viewport.get('width', 1280),
                     'height': self.config.viewport.get('height', 720)
                 }
-            )
+            }
+            
+            if self.config.persistent_context:
+                # On-disk profile keeps the HTTP cache and cookies between jobs
+                self.context = await browser_pool.acquire_persistent_context(
+                    self.config.user_data_dir, self.config.headless, **context_options
+                )
+            else:
+                self.context = await browser_pool.acquire_context(self.config.headless, **context_options)
+            self.browser = self.context.browser
+            
+            # Persistent contexts open with a blank page; reuse it for the first URL
+            self._idle_pages.extend(self.context.pages)
+            
+            # Skip downloading resources the scraper does not need
+            if self._blocked_resources:
+                await self.context.route('**/*', self._route_request)
             
             self.logger.info("Browser initialized successfully")
             
-        except Exception as e:
+        except BaseException as e:
             self.logger.error(f"Failed to initialize browser: {str(e)}")
+            # Release a context acquired before the failure, freeing its profile lock
+            if self.context:
+                await self.close()
             raise
     
+    def get_blocked_resources(self) -> frozenset:
+        """
+        Resolve the request types to block from the configuration.
+        
+        Returns:
+            Set of Playwright resource types (plus 'analytics') to abort
+        """
+        blocked = set(self.config.block_resources)
+        if not self.config.images_enabled:
+            blocked.add('image')
+        if not self.config.css_enabled:
+            blocked.add('stylesheet')
+        return frozenset(blocked)
+    
+    async def _route_request(self, route):
+        """Abort blocked requests and let everything else through."""
+        request = route.request
+        
+        if request.resource_type in self._blocked_resources:
+            await route.abort()
+            return
+        
+        if 'analytics' in self._blocked_resources:
+            host = urlparse(request.url).hostname or ''
+            if host.endswith(ANALYTICS_HOSTS):
+                await route.abort()
+                return
+        
+        await route.continue_()
+    
     async def close(self):
-        """Close browser and cleanup resources."""
+        """Release the browser context; the browser itself stays in the pool."""
         try:
+            # Pooled pages are closed together with their context
+            self._idle_pages.clear()
             if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if hasattr(self, 'playwright'):
-                await self.playwright.stop()
-            self.logger.info("Browser closed successfully")
+                await browser_pool.release(self.context)
+                self.context = None
+                self.browser = None
+            self.logger.info("Browser context closed successfully")
         except Exception as e:
-            self.logger.error(f"Error closing browser: {str(e)}")
+            self.logger.error(f"Error closing browser context: {str(e)}")
     
     async def scrape(self) -> List[Dict[str, Any]]:
         """
         Main scraping method that orchestrates the entire process.
         
+        When `stream_output` is configured, items are written to that JSONL file
+        as pages finish and an empty list is returned; `items_streamed` holds
+        the number of items written.
+        
         Returns:
             List of dictionaries containing scraped data
         """
-        if not self.browser:
+        if not self.context:
             await self.initialize_browser()
         
         try:
             # Handle single URL or multiple URLs
             urls = [self.config.url] if isinstance(self.config.url, str) else self.config.url
+            urls = urls[:self.config.max_pages]
             all_scraped_data = []
             
-            for url in urls[:self.config.max_pages]:
-                self.logger.info(f"Scraping URL: {url}")
-                page_data = await self.scrape_page(url)
-                
-                if page_data:
+            # Optionally stream items to a JSONL file through a single writer task
+            queue = None
+            if self.config.stream_output:
+                stream_file = open(self.config.stream_output, 'wb')
+                queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+                writer = asyncio.create_task(self._stream_writer(queue, stream_file))
+            
+            try:
+                # Scrape pages concurrently in the shared context, bounded by the semaphore
+                semaphore = asyncio.BoundedSemaphore(self.config.max_parallel_pages)
+                results = await asyncio.gather(
+                    *(self._scrape_one(url, semaphore, len(urls) > 1, queue) for url in urls),
+                    return_exceptions=True
+                )
+            finally:
+                if queue is not None:
+                    await queue.put(None)
+                    try:
+                        await writer
+                    finally:
+                        stream_file.close()
+            
+            errors = []
+            for page_data in results:
+                if isinstance(page_data, BaseException):
+                    errors.append(page_data)
+                else:
                     all_scraped_data.extend(page_data)
-                    self.logger.info(f"Scraped {len(page_data)} items from {url}")
-                
-                # Add delay between pages
-                if len(urls) > 1:
-                    await asyncio.sleep(self.config.delay)
+            
+            # One failing page does not discard the others, unless every page failed
+            if errors and len(errors) == len(urls):
+                raise errors[0]
             
             return all_scraped_data
             
@@ -123,6 +446,72 @@ class PlaywrightScraper:
         finally:
             await self.close()
     
+    async def _scrape_one(self, url: str, semaphore: asyncio.BoundedSemaphore,
+                          stagger: bool, queue: Optional[asyncio.Queue] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape one page once a slot in the page pool is free.
+        
+        Args:
+            url: Target URL to scrape
+            semaphore: Semaphore bounding the number of open pages
+            stagger: Add a jittered delay before the request to stay polite
+            queue: Stream writer queue; when given, items are handed to it
+                instead of being returned
+            
+        Returns:
+            List of dictionaries containing scraped data from the page
+        """
+        async with semaphore:
+            if stagger:
+                await asyncio.sleep(random.uniform(0, self.config.delay))
+            
+            self.logger.info(f"Scraping URL: {url}")
+            page_data = await self.scrape_page(url)
+        
+        self.logger.info(f"Scraped {len(page_data)} items from {url}")
+        
+        if queue is None:
+            return page_data
+        
+        for item in page_data:
+            await queue.put(item)
+        self.items_streamed += len(page_data)
+        return []
+    
+    async def _stream_writer(self, queue: asyncio.Queue, stream_file):
+        """
+        Drain the queue to the stream file as JSON lines until a None sentinel.
+        
+        Items are written in batches off the event loop. After a write error the
+        queue is still drained, so producers never block, and the error is
+        raised at the end.
+        
+        Args:
+            queue: Queue of scraped items, terminated by None
+            stream_file: Open binary file to append lines to
+        """
+        error = None
+        done = False
+        
+        while not done:
+            batch = [await queue.get()]
+            while not queue.empty() and len(batch) < STREAM_BATCH_SIZE:
+                batch.append(queue.get_nowait())
+            
+            if batch[-1] is None:
+                batch.pop()
+                done = True
+            
+            if batch and error is None:
+                try:
+                    await asyncio.to_thread(_write_json_lines, stream_file, batch)
+                except Exception as e:
+                    self.logger.error(f"Failed to write to {self.config.stream_output}: {str(e)}")
+                    error = e
+        
+        if error is not None:
+            raise error
+    
     async def scrape_page(self, url: str) -> List[Dict[str, Any]]:
         """
         Scrape a single page using configured selectors.
@@ -135,38 +524,46 @@ class PlaywrightScraper:
         """
         if not self.context:
             raise RuntimeError("Browser context not initialized")
-        page = await self.context.new_page()
+        page = await self._acquire_page()
         scraped_data = []
         
         try:
             # Navigate to page
             self.logger.info(f"Navigating to: {url}")
-            await page.goto(url, timeout=self.config.timeout)
+            await self._goto_with_retry(page, url)
             
-            # Wait for specific selector if configured
+            # Wait for specific selector if configured; it is the real readiness signal
             if self.config.wait_for_selector:
                 self.logger.info(f"Waiting for selector: {self.config.wait_for_selector}")
                 await page.wait_for_selector(self.config.wait_for_selector, timeout=self.config.timeout)
-            
-            # Wait for page to load
-            await page.wait_for_load_state('networkidle')
+            else:
+                # Otherwise give the network a short, bounded time to settle
+                try:
+                    await page.wait_for_load_state('networkidle', timeout=NETWORK_SETTLE_TIMEOUT)
+                except PlaywrightTimeoutError:
+                    pass
             
             # Handle basic interactions if needed
             await self.handle_page_interactions(page)
             
-            # Extract data using selectors
+            # Extract data using selectors, one evaluate call per selector
             for selector in self.config.selectors:
                 try:
-                    elements = await page.query_selector_all(selector)
+                    elements = await page.eval_on_selector_all(selector, EXTRACT_ELEMENTS_JS)
+                    timestamp = time.monotonic()
                     
                     for i, element in enumerate(elements):
-                        data_item = await self.extract_element_data(element, selector, i, url)
-                        if data_item:
-                            scraped_data.append(data_item)
-                            
+                        scraped_data.append(self.build_element_data(element, selector, i, url, timestamp))
+                        
                 except Exception as e:
-                    self.logger.warning(f"Failed to extract data for selector '{selector}': {str(e)}")
-                    continue
+                    self.logger.debug(f"Bulk extraction failed for selector '{selector}': {str(e)}")
+                    
+                    # Fall back to extracting element by element
+                    try:
+                        scraped_data.extend(await self.extract_elements(page, selector, url))
+                    except Exception as e:
+                        self.logger.warning(f"Failed to extract data for selector '{selector}': {str(e)}")
+                        continue
             
             # Add delay to avoid being blocked
             await asyncio.sleep(random.uniform(0.5, 1.5))
@@ -175,10 +572,66 @@ class PlaywrightScraper:
             self.logger.error(f"Failed to scrape page {url}: {str(e)}")
             raise
         finally:
-            await page.close()
+            await self._release_page(page)
         
         return scraped_data
     
+    async def _goto_with_retry(self, page: Page, url: str, attempts: int = NAVIGATION_ATTEMPTS):
+        """
+        Navigate to a URL, retrying failed navigations with exponential backoff.
+        
+        Args:
+            page: Page to navigate
+            url: Target URL
+            attempts: Total number of navigation attempts
+            
+        Returns:
+            Main resource response, as returned by page.goto
+        """
+        delay = NAVIGATION_RETRY_DELAY
+        for attempt in range(1, attempts + 1):
+            try:
+                return await page.goto(url, timeout=self.config.timeout, wait_until='domcontentloaded')
+            except PlaywrightError as e:
+                if attempt == attempts:
+                    raise
+                self.logger.warning(f"Navigation to {url} failed (attempt {attempt}/{attempts}): {str(e)}")
+                await asyncio.sleep(delay + random.random() * 0.25)
+                delay *= 2
+    
+    async def _acquire_page(self) -> Page:
+        """
+        Take an idle page from this scraper's pool, or open a new one.
+        
+        The page-pool semaphore in scrape() bounds concurrent pages, so the pool
+        never grows beyond max_parallel_pages.
+        
+        Returns:
+            Page ready for navigation
+        """
+        if self._idle_pages:
+            return self._idle_pages.pop()
+        return await self.context.new_page()
+    
+    async def _release_page(self, page: Page):
+        """
+        Reset a page to about:blank and return it to the pool for the next URL.
+        
+        Pages that cannot be reset are closed instead.
+        
+        Args:
+            page: Page obtained from _acquire_page
+        """
+        try:
+            await page.goto('about:blank')
+            self._idle_pages.append(page)
+        except Exception as e:
+            self.logger.debug(f"Discarding page that could not be reset: {str(e)}")
+            try:
+                await page.close()
+            except Exception:
+                pass
+    
     async def handle_page_interactions(self, page: Page):
         """
         Handle basic page interactions like clicking, scrolling.
@@ -187,34 +640,87 @@ class PlaywrightScraper:
             page: Playwright page object
         """
         try:
-            # Check for cookie banners and dismiss them
-            cookie_selectors = [
-                '[id*="cookie"]',
-                '[class*="cookie"]',
-                '[id*="consent"]',
-                '[class*="consent"]',
-                'button[aria-label*="Accept"]',
-                'button[aria-label*="Close"]'
-            ]
-            
-            for selector in cookie_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible():
-                        await element.click()
-                        await asyncio.sleep(0.5)
-                        break
-                except:
-                    continue
-            
-            # Scroll to load dynamic content
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight/2)")
-            await asyncio.sleep(1)
-            await page.evaluate("window.scrollTo(0, 0)")
+            # Check for cookie banners and dismiss them, in a single round-trip
+            dismissed = await page.evaluate(DISMISS_COOKIE_BANNER_JS, list(COOKIE_SELECTORS))
+            if dismissed:
+                self.logger.debug(f"Dismissed cookie banner: {dismissed}")
+                await asyncio.sleep(0.5)
+            
+            # Scroll to load dynamic content, then give it a bounded time to settle
+            await page.evaluate(SCROLL_PAGE_JS)
+            try:
+                await page.wait_for_load_state('networkidle', timeout=1000)
+            except PlaywrightTimeoutError:
+                pass
             
         except Exception as e:
             self.logger.debug(f"Page interaction warning: {str(e)}")
     
+    def build_element_data(self, element: Dict[str, Any], selector: str, index: int,
+                           url: str, timestamp: float) -> Dict[str, Any]:
+        """
+        Build a data item from the fields returned by EXTRACT_ELEMENTS_JS.
+        
+        Args:
+            element: Fields extracted from the element in the browser
+            selector: CSS selector used to find the element
+            index: Index of the element in the selector results
+            url: Source URL
+            timestamp: Extraction time
+            
+        Returns:
+            Dictionary containing extracted data
+        """
+        data_item = {
+            'url': url,
+            'selector': selector,
+            'index': index,
+            'timestamp': timestamp
+        }
+        
+        if element['text']:
+            data_item['text'] = element['text']
+        
+        if element['html']:
+            data_item['html'] = element['html']
+        
+        if element['attributes']:
+            data_item['attributes'] = element['attributes']
+        
+        # Already absolute, resolved in the browser
+        if element['link']:
+            data_item['link'] = element['link']
+        
+        if element['image_src']:
+            data_item['image_src'] = element['image_src']
+        
+        if element['data_attributes']:
+            data_item['data_attributes'] = element['data_attributes']
+        
+        return data_item
+    
+    async def extract_elements(self, page: Page, selector: str, url: str) -> List[Dict[str, Any]]:
+        """
+        Extract data element by element (fallback for bulk extraction).
+        
+        Args:
+            page: Playwright page object
+            selector: CSS selector to extract
+            url: Source URL
+            
+        Returns:
+            List of dictionaries containing extracted data
+        """
+        scraped_data = []
+        elements = await page.query_selector_all(selector)
+        
+        for i, element in enumerate(elements):
+            data_item = await self.extract_element_data(element, selector, i, url)
+            if data_item:
+                scraped_data.append(data_item)
+        
+        return scraped_data
+    
     async def extract_element_data(self, element, selector: str, index: int, url: str) -> Dict[str, Any]:
         """
         Extract data from a single element.
@@ -229,65 +735,9 @@ class PlaywrightScraper:
             Dictionary containing extracted data
         """
         try:
-            data_item = {
-                'url': url,
-                'selector': selector,
-                'index': index,
-                'timestamp': asyncio.get_event_loop().time()
-            }
-            
-            # Extract text content
-            text_content = await element.text_content()
-            if text_content:
-                data_item['text'] = text_content.strip()
-            
-            # Extract inner HTML
-            inner_html = await element.inner_html()
-            if inner_html:
-                data_item['html'] = inner_html.strip()
-            
-            # Extract attributes
-            attributes = await element.evaluate('''
-                element => {
-                    const attrs = {};
-                    for (let attr of element.attributes) {
-                        attrs[attr.name] = attr.value;
-                    }
-                    return attrs;
-                }
-            ''')
-            if attributes:
-                data_item['attributes'] = attributes
-            
-            # Extract links if present
-            href = await element.get_attribute('href')
-            if href:
-                # Convert relative URLs to absolute
-                absolute_url = urljoin(url, href)
-                data_item['link'] = absolute_url
-            
-            # Extract image sources
-            src = await element.get_attribute('src')
-            if src:
-                absolute_src = urljoin(url, src)
-                data_item['image_src'] = absolute_src
-            
-            # Extract data attributes
-            data_attrs = await element.evaluate('''
-                element => {
-                    const dataAttrs = {};
-                    for (let attr of element.attributes) {
-                        if (attr.name.startsWith('data-')) {
-                            dataAttrs[attr.name] = attr.value;
-                        }
-                    }
-                    return dataAttrs;
-                }
-            ''')
-            if data_attrs:
-                data_item['data_attributes'] = data_attrs
-            
-            return data_item
+            # All fields in one round-trip, with the same script as bulk extraction
+            element_data = await element.evaluate(EXTRACT_ELEMENT_JS)
+            return self.build_element_data(element_data, selector, index, url, time.monotonic())
             
         except Exception as e:
             self.logger.warning(f"Failed to extract data from element: {str(e)}")
@@ -2,13 +2,56 @@
 Utility functions for the Playwright Web Scraper.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import re
+import time
+from functools import lru_cache
 from urllib.parse import urlparse
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Whether the JSON helpers below are backed by orjson
+ORJSON_AVAILABLE = orjson is not None
+
+# Precompiled patterns for the text helpers
+_WHITESPACE_RE = re.compile(r'\s+')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_MULTI_UNDERSCORE_RE = re.compile(r'_+')
+_INVALID_SELECTOR_RE = re.compile(r'[<>{}()]')
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Background listener that writes queued log records to the real handlers
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Browser detection, checked in order: (token, browser name, version pattern).
+# Chrome user agents also mention Safari, so Chrome must come first
+_BROWSER_PATTERNS = (
+    ('Chrome', 'Chrome', re.compile(r'Chrome/(\d+\.\d+)')),
+    ('Firefox', 'Firefox', re.compile(r'Firefox/(\d+\.\d+)')),
+    ('Safari', 'Safari', re.compile(r'Safari/(\d+\.\d+)'))
+)
+
+# OS detection, checked in order: (tokens, OS name)
+_OS_PATTERNS = (
+    (('Windows',), 'Windows'),
+    (('Macintosh', 'Mac OS'), 'macOS'),
+    (('Linux',), 'Linux'),
+    (('Android',), 'Android'),
+    (('iPhone', 'iPad'), 'iOS')
+)
+
 
 def setup_logging(log_level: str = 'INFO'):
     """
@@ -21,15 +64,29 @@ def setup_logging(log_level: str = 'INFO'):
     logs_dir = Path('logs')
     logs_dir.mkdir(exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
+    global _log_listener
+    level = getattr(logging, log_level.upper())
+    
+    if _log_listener is None:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
             logging.FileHandler(logs_dir / 'scraper.log', encoding='utf-8'),
             logging.StreamHandler(sys.stdout)
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Loggers only enqueue records; file and console writes happen on the listener thread
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=level, handlers=[queue_handler])
+    
+    logging.getLogger().setLevel(level)
     
     # Set specific log levels for external libraries
     logging.getLogger('playwright').setLevel(logging.WARNING)
@@ -46,9 +103,20 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL is valid, False otherwise
     """
-    if not url:
+    if not url or not isinstance(url, str):
+        return False
+    
+    # A scheme and a netloc imply "<scheme>://" near the start; reject anything
+    # else before paying for urlparse (or a cache slot)
+    if url.find('://') < 1:
         return False
     
+    return _validate_url(url)
+
+
+@lru_cache(maxsize=4096)
+def _validate_url(url: str) -> bool:
+    """Memoized URL check; the same URLs are validated over and over."""
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -70,10 +138,10 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespace and newlines
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove special characters that might cause issues
-    text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+    text = _CONTROL_CHARS_RE.sub('', text)
     
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -91,6 +159,15 @@ def extract_domain(url: str) -> Optional[str]:
     Returns:
         Domain name or None if invalid URL
     """
+    if not isinstance(url, str):
+        return None
+    
+    return _extract_domain(url)
+
+
+@lru_cache(maxsize=4096)
+def _extract_domain(url: str) -> Optional[str]:
+    """Memoized domain extraction."""
     try:
         parsed = urlparse(url)
         return parsed.netloc.lower()
@@ -111,9 +188,14 @@ def is_valid_selector(selector: str) -> bool:
     if not selector or not isinstance(selector, str):
         return False
     
+    return _is_valid_selector(selector)
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_selector(selector: str) -> bool:
+    """Memoized selector check."""
     # Basic validation for common CSS selector patterns
-    invalid_chars = ['<', '>', '{', '}', '(', ')']
-    if any(char in selector for char in invalid_chars):
+    if _INVALID_SELECTOR_RE.search(selector):
         return False
     
     # Check for empty selector
@@ -133,16 +215,19 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes = int(size_bytes / 1024.0)
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    value = size_bytes / (1 << (10 * i))
+    
+    # Values just below a boundary round up to 1024.0; show them in the next unit
+    if round(value, 1) >= 1024 and i < len(_SIZE_UNITS) - 1:
         i += 1
+        value /= 1024
     
-    return f"{size_bytes:.1f} {size_names[i]}"
+    return f"{value:.1f} {_SIZE_UNITS[i]}"
 
 
 def safe_filename(filename: str) -> str:
@@ -156,10 +241,10 @@ def safe_filename(filename: str) -> str:
         Safe filename
     """
     # Remove or replace invalid characters
-    safe_chars = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    safe_chars = _UNSAFE_FILENAME_RE.sub('_', filename)
     
     # Remove multiple underscores
-    safe_chars = re.sub(r'_+', '_', safe_chars)
+    safe_chars = _MULTI_UNDERSCORE_RE.sub('_', safe_chars)
     
     # Trim and remove leading/trailing dots and spaces
     safe_chars = safe_chars.strip('. ')
@@ -171,6 +256,50 @@ def safe_filename(filename: str) -> str:
     return safe_chars
 
 
+def json_dumps(obj: Any, *, default: Optional[Callable[[Any], Any]] = None,
+               indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when available.
+    
+    Both backends produce the same layout: compact (or two-space indented),
+    non-ASCII characters kept as-is and non-string keys converted to strings.
+    
+    Args:
+        obj: Object to serialize
+        default: Called for objects that are not natively serializable
+        indent: Indent with two spaces
+        
+    Returns:
+        JSON document as bytes
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    
+    if indent:
+        text = json.dumps(obj, default=default, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, default=default, ensure_ascii=False, separators=(',', ':'))
+    return text.encode('utf-8')
+
+
+def json_loads(data) -> Any:
+    """
+    Parse a JSON document from bytes or str, using orjson when available.
+    
+    Args:
+        data: JSON document
+        
+    Returns:
+        Parsed object
+    """
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def merge_configs(base_config: Dict[str, Any], override_config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Merge two configuration dictionaries.
@@ -184,11 +313,16 @@ def merge_configs(base_config: Dict[str, Any], override_config: Dict[str, Any])
     """
     merged = base_config.copy()
     
-    for key, value in override_config.items():
-        if isinstance(value, dict) and key in merged and isinstance(merged[key], dict):
-            merged[key] = merge_configs(merged[key], value)
-        else:
-            merged[key] = value
+    # Only subtrees touched by the override are copied; untouched ones are shared
+    stack = [(merged, override_config)]
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            if isinstance(value, dict) and isinstance(target.get(key), dict):
+                target[key] = target[key].copy()
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     
     return merged
 
@@ -213,33 +347,19 @@ def get_user_agent_info(user_agent: str) -> Dict[str, str]:
         return info
     
     # Browser detection
-    if 'Chrome' in user_agent:
-        info['browser'] = 'Chrome'
-        chrome_match = re.search(r'Chrome/(\d+\.\d+)', user_agent)
-        if chrome_match:
-            info['version'] = chrome_match.group(1)
-    elif 'Firefox' in user_agent:
-        info['browser'] = 'Firefox'
-        firefox_match = re.search(r'Firefox/(\d+\.\d+)', user_agent)
-        if firefox_match:
-            info['version'] = firefox_match.group(1)
-    elif 'Safari' in user_agent and 'Chrome' not in user_agent:
-        info['browser'] = 'Safari'
-        safari_match = re.search(r'Safari/(\d+\.\d+)', user_agent)
-        if safari_match:
-            info['version'] = safari_match.group(1)
+    for token, browser, version_re in _BROWSER_PATTERNS:
+        if token in user_agent:
+            info['browser'] = browser
+            version_match = version_re.search(user_agent)
+            if version_match:
+                info['version'] = version_match.group(1)
+            break
     
     # OS detection
-    if 'Windows' in user_agent:
-        info['os'] = 'Windows'
-    elif 'Macintosh' in user_agent or 'Mac OS' in user_agent:
-        info['os'] = 'macOS'
-    elif 'Linux' in user_agent:
-        info['os'] = 'Linux'
-    elif 'Android' in user_agent:
-        info['os'] = 'Android'
-    elif 'iPhone' in user_agent or 'iPad' in user_agent:
-        info['os'] = 'iOS'
+    for tokens, os_name in _OS_PATTERNS:
+        if any(token in user_agent for token in tokens):
+            info['os'] = os_name
+            break
     
     return info
 
@@ -249,15 +369,25 @@ class ProgressTracker:
     Simple progress tracking utility.
     """
     
-    def __init__(self, total: int, description: str = "Progress"):
+    def __init__(self, total: int, description: str = "Progress",
+                 log_every: int = 100, log_interval: float = 1.0):
         self.total = total
         self.current = 0
         self.description = description
         self.logger = logging.getLogger(__name__)
+        self._log_every = max(1, log_every)
+        self._log_interval = log_interval
+        self._last_log_t = 0.0
     
     def update(self, increment: int = 1):
-        """Update progress counter."""
+        """Update progress counter, logging at most every ``log_every`` items or ``log_interval`` seconds."""
         self.current += increment
+        now = time.monotonic()
+        if (self.current % self._log_every and now - self._last_log_t < self._log_interval
+                and self.current < self.total):
+            return
+        
+        self._last_log_t = now
         percentage = (self.current / self.total) * 100 if self.total > 0 else 0
         self.logger.info(f"{self.description}: {self.current}/{self.total} ({percentage:.1f}%)")
     
@@ -2,21 +2,152 @@
 Additional web interface utilities and helpers.
 """
 
-from flask import Blueprint, request, jsonify
-import json
-from typing import Dict, Any, List
+from flask import Blueprint, Response, request
+import hashlib
+from typing import Dict, Any, List, Tuple
 from config import ScrapingConfig, DEFAULT_CONFIGS, create_config_template
-from utils import validate_url, is_valid_selector
+from utils import json_dumps, validate_url, is_valid_selector
 import logging
 
 # Create blueprint for API routes
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 logger = logging.getLogger(__name__)
 
+# Browser cache lifetime (seconds) for the static endpoints below
+STATIC_MAX_AGE = 3600
 
-@api_bp.route('/config/templates')
-def get_config_templates():
-    """Get available configuration templates."""
+
+# Numeric fields checked by validate_config:
+# (key, default, cast, is_valid, type error, value error)
+NUMERIC_FIELDS = (
+    ('delay', 1.0, float, lambda value: value >= 0,
+     "Delay must be a valid number", "Delay must be non-negative"),
+    ('timeout', 30000, int, lambda value: value > 0,
+     "Timeout must be a valid integer", "Timeout must be positive"),
+    ('max_pages', 1, int, lambda value: value > 0,
+     "Max pages must be a valid integer", "Max pages must be positive")
+)
+
+VIEWPORT_FIELDS = (
+    ('width', 1280, int, lambda value: value > 0,
+     "Viewport dimensions must be valid integers", "Viewport dimensions must be positive"),
+    ('height', 720, int, lambda value: value > 0,
+     "Viewport dimensions must be valid integers", "Viewport dimensions must be positive")
+)
+
+
+# Common CSS selectors, grouped by use case
+SELECTOR_SUGGESTIONS = {
+    'content': [
+        'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+        'p', 'span', 'div',
+        'article', 'section', 'main'
+    ],
+    'links': [
+        'a', 'a[href]',
+        'nav a', '.menu a', '.navigation a'
+    ],
+    'lists': [
+        'ul', 'ol', 'li',
+        '.list-item', '.item'
+    ],
+    'forms': [
+        'form', 'input', 'textarea', 'select', 'button',
+        'input[type="text"]', 'input[type="email"]'
+    ],
+    'media': [
+        'img', 'video', 'audio',
+        'img[src]', 'img[alt]'
+    ],
+    'data': [
+        '[data-*]', '[data-id]', '[data-value]',
+        '.price', '.title', '.description', '.rating'
+    ],
+    'common_classes': [
+        '.content', '.article', '.post', '.item',
+        '.title', '.heading', '.description', '.summary',
+        '.price', '.cost', '.amount', '.value',
+        '.date', '.time', '.timestamp',
+        '.author', '.by', '.byline',
+        '.rating', '.score', '.stars',
+        '.tag', '.category', '.label'
+    ],
+    'ecommerce': [
+        '.product-title', '.product-name', '.item-name',
+        '.price', '.cost', '.amount', '.sale-price',
+        '.description', '.details', '.specs',
+        '.rating', '.reviews', '.stars',
+        '.availability', '.stock', '.in-stock',
+        '.add-to-cart', '.buy-now'
+    ],
+    'news': [
+        '.headline', '.title', '.article-title',
+        '.byline', '.author', '.journalist',
+        '.publish-date', '.date', '.timestamp',
+        '.article-content', '.story', '.content',
+        '.summary', '.excerpt', '.lead'
+    ]
+}
+
+
+# Export formats supported by DataExporter
+EXPORT_FORMATS = {
+    'json': {
+        'name': 'JSON',
+        'description': 'JavaScript Object Notation - preserves data structure',
+        'extension': '.json',
+        'features': ['Nested data', 'Data types', 'Metadata']
+    },
+    'csv': {
+        'name': 'CSV',
+        'description': 'Comma-Separated Values - spreadsheet compatible',
+        'extension': '.csv',
+        'features': ['Tabular format', 'Excel compatible', 'Flattened data']
+    },
+    'excel': {
+        'name': 'Excel',
+        'description': 'Microsoft Excel format with metadata',
+        'extension': '.xlsx',
+        'features': ['Multiple sheets', 'Metadata', 'Formatting']
+    }
+}
+
+
+# Scraping tips and best practices
+SCRAPING_TIPS = {
+    'general': [
+        "Start with simple selectors like 'h1', 'p', or '.class-name'",
+        "Use browser developer tools to inspect elements and find selectors",
+        "Test selectors on a single page before scraping multiple pages",
+        "Be respectful of websites and don't overload them with requests",
+        "Check robots.txt file before scraping a website"
+    ],
+    'selectors': [
+        "Use specific selectors to get exactly what you need",
+        "Combine selectors with commas to extract multiple elements",
+        "Use attribute selectors like '[data-testid=\"value\"]' for dynamic content",
+        "Try different selector strategies if the first one doesn't work",
+        "Use descendant selectors like '.article h2' for more precision"
+    ],
+    'performance': [
+        "Increase delay between requests if you encounter rate limiting",
+        "Disable image loading to speed up scraping",
+        "Use headless mode for better performance",
+        "Limit the number of pages to scrape initially",
+        "Monitor memory usage for large scraping tasks"
+    ],
+    'troubleshooting': [
+        "If elements don't load, try increasing the timeout",
+        "Use 'wait_for_selector' for dynamic content that loads after page load",
+        "Check the browser console for JavaScript errors",
+        "Try non-headless mode if headless fails",
+        "Verify that the website structure hasn't changed"
+    ]
+}
+
+
+def _config_templates() -> Dict[str, Dict[str, Any]]:
+    """Describe the default configuration templates."""
     templates = {}
     for name, config in DEFAULT_CONFIGS.items():
         templates[name] = {
@@ -24,8 +155,75 @@ def get_config_templates():
             'description': f"Pre-configured settings for {name.replace('_', ' ')} scraping",
             'config': config
         }
+    return templates
+
+
+def _json(payload: Any, status: int = 200) -> Response:
+    """Build a JSON response without going through jsonify."""
+    return Response(json_dumps(payload), status=status, mimetype='application/json')
+
+
+def _check_numeric_fields(source: Dict[str, Any], fields, errors: List[str]):
+    """
+    Coerce and check numeric fields, appending each distinct error once.
     
-    return jsonify(templates)
+    Args:
+        source: Request data holding the fields
+        fields: Field table such as NUMERIC_FIELDS
+        errors: Error list to append to
+    """
+    for key, default, cast, is_valid, type_error, value_error in fields:
+        try:
+            value = cast(source.get(key, default))
+        except (ValueError, TypeError):
+            error = type_error
+        else:
+            if is_valid(value):
+                continue
+            error = value_error
+        
+        if error not in errors:
+            errors.append(error)
+
+
+def _precompute_json(payload: Any) -> Tuple[bytes, str]:
+    """
+    Serialize a static payload once and derive its ETag.
+    
+    Args:
+        payload: JSON-serializable data
+        
+    Returns:
+        Tuple of (JSON body, ETag)
+    """
+    body = json_dumps(payload)
+    return body, hashlib.sha1(body).hexdigest()
+
+
+def _static_json_response(body: bytes, etag: str) -> Response:
+    """
+    Serve a precomputed JSON body with caching headers.
+    
+    Answers 304 Not Modified when the client's If-None-Match matches.
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    return response.make_conditional(request)
+
+
+# Static endpoint bodies, serialized once at import
+_SUGGESTIONS_JSON = _precompute_json(SELECTOR_SUGGESTIONS)
+_FORMATS_JSON = _precompute_json(EXPORT_FORMATS)
+_TIPS_JSON = _precompute_json(SCRAPING_TIPS)
+_TEMPLATES_JSON = _precompute_json(_config_templates())
+
+
+@api_bp.route('/config/templates')
+def get_config_templates():
+    """Get available configuration templates."""
+    return _static_json_response(*_TEMPLATES_JSON)
 
 
 @api_bp.route('/config/validate', methods=['POST'])
@@ -53,39 +251,11 @@ def validate_config():
                 if not is_valid_selector(selector):
                     errors.append(f"Invalid selector: '{selector}'")
         
-        # Validate numeric values
-        try:
-            delay = float(data.get('delay', 1.0))
-            if delay < 0:
-                errors.append("Delay must be non-negative")
-        except (ValueError, TypeError):
-            errors.append("Delay must be a valid number")
-        
-        try:
-            timeout = int(data.get('timeout', 30000))
-            if timeout <= 0:
-                errors.append("Timeout must be positive")
-        except (ValueError, TypeError):
-            errors.append("Timeout must be a valid integer")
-        
-        try:
-            max_pages = int(data.get('max_pages', 1))
-            if max_pages <= 0:
-                errors.append("Max pages must be positive")
-        except (ValueError, TypeError):
-            errors.append("Max pages must be a valid integer")
-        
-        # Validate viewport
-        viewport = data.get('viewport', {})
-        try:
-            width = int(viewport.get('width', 1280))
-            height = int(viewport.get('height', 720))
-            if width <= 0 or height <= 0:
-                errors.append("Viewport dimensions must be positive")
-        except (ValueError, TypeError):
-            errors.append("Viewport dimensions must be valid integers")
+        # Validate numeric values and viewport
+        _check_numeric_fields(data, NUMERIC_FIELDS, errors)
+        _check_numeric_fields(data.get('viewport', {}), VIEWPORT_FIELDS, errors)
         
-        return jsonify({
+        return _json({
             'valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings
@@ -93,132 +263,30 @@ def validate_config():
         
     except Exception as e:
         logger.error(f"Config validation error: {str(e)}")
-        return jsonify({'error': str(e)}), 500
+        return _json({'error': str(e)}, 500)
 
 
 @api_bp.route('/selectors/suggestions')
 def get_selector_suggestions():
     """Get common CSS selector suggestions."""
-    suggestions = {
-        'content': [
-            'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-            'p', 'span', 'div',
-            'article', 'section', 'main'
-        ],
-        'links': [
-            'a', 'a[href]',
-            'nav a', '.menu a', '.navigation a'
-        ],
-        'lists': [
-            'ul', 'ol', 'li',
-            '.list-item', '.item'
-        ],
-        'forms': [
-            'form', 'input', 'textarea', 'select', 'button',
-            'input[type="text"]', 'input[type="email"]'
-        ],
-        'media': [
-            'img', 'video', 'audio',
-            'img[src]', 'img[alt]'
-        ],
-        'data': [
-            '[data-*]', '[data-id]', '[data-value]',
-            '.price', '.title', '.description', '.rating'
-        ],
-        'common_classes': [
-            '.content', '.article', '.post', '.item',
-            '.title', '.heading', '.description', '.summary',
-            '.price', '.cost', '.amount', '.value',
-            '.date', '.time', '.timestamp',
-            '.author', '.by', '.byline',
-            '.rating', '.score', '.stars',
-            '.tag', '.category', '.label'
-        ],
-        'ecommerce': [
-            '.product-title', '.product-name', '.item-name',
-            '.price', '.cost', '.amount', '.sale-price',
-            '.description', '.details', '.specs',
-            '.rating', '.reviews', '.stars',
-            '.availability', '.stock', '.in-stock',
-            '.add-to-cart', '.buy-now'
-        ],
-        'news': [
-            '.headline', '.title', '.article-title',
-            '.byline', '.author', '.journalist',
-            '.publish-date', '.date', '.timestamp',
-            '.article-content', '.story', '.content',
-            '.summary', '.excerpt', '.lead'
-        ]
-    }
-    
-    return jsonify(suggestions)
+    return _static_json_response(*_SUGGESTIONS_JSON)
 
 
 @api_bp.route('/export/formats')
 def get_export_formats():
     """Get available export formats."""
-    formats = {
-        'json': {
-            'name': 'JSON',
-            'description': 'JavaScript Object Notation - preserves data structure',
-            'extension': '.json',
-            'features': ['Nested data', 'Data types', 'Metadata']
-        },
-        'csv': {
-            'name': 'CSV',
-            'description': 'Comma-Separated Values - spreadsheet compatible',
-            'extension': '.csv',
-            'features': ['Tabular format', 'Excel compatible', 'Flattened data']
-        },
-        'excel': {
-            'name': 'Excel',
-            'description': 'Microsoft Excel format with metadata',
-            'extension': '.xlsx',
-            'features': ['Multiple sheets', 'Metadata', 'Formatting']
-        }
-    }
-    
-    return jsonify(formats)
+    return _static_json_response(*_FORMATS_JSON)
 
 
 def get_scraping_tips() -> Dict[str, List[str]]:
     """Get helpful scraping tips for users."""
-    return {
-        'general': [
-            "Start with simple selectors like 'h1', 'p', or '.class-name'",
-            "Use browser developer tools to inspect elements and find selectors",
-            "Test selectors on a single page before scraping multiple pages",
-            "Be respectful of websites and don't overload them with requests",
-            "Check robots.txt file before scraping a website"
-        ],
-        'selectors': [
-            "Use specific selectors to get exactly what you need",
-            "Combine selectors with commas to extract multiple elements",
-            "Use attribute selectors like '[data-testid=\"value\"]' for dynamic content",
-            "Try different selector strategies if the first one doesn't work",
-            "Use descendant selectors like '.article h2' for more precision"
-        ],
-        'performance': [
-            "Increase delay between requests if you encounter rate limiting",
-            "Disable image loading to speed up scraping",
-            "Use headless mode for better performance",
-            "Limit the number of pages to scrape initially",
-            "Monitor memory usage for large scraping tasks"
-        ],
-        'troubleshooting': [
-            "If elements don't load, try increasing the timeout",
-            "Use 'wait_for_selector' for dynamic content that loads after page load",
-            "Check the browser console for JavaScript errors",
-            "Try non-headless mode if headless fails",
-            "Verify that the website structure hasn't changed"
-        ]
-    }
+    return SCRAPING_TIPS
 
 
 @api_bp.route('/help/tips')
 def get_tips():
     """Get scraping tips and best practices."""
-    return jsonify(get_scraping_tips())
+    return _static_json_response(*_TIPS_JSON)
 
 
 @api_bp.route('/stats/summary')
@@ -235,4 +303,4 @@ def get_scraping_stats():
         'average_items_per_task': 0
     }
     
-    return jsonify(stats)
+    return _json(stats)